@@ -1,247 +1,580 @@
-"""!
-@file services/billboard.py
-@brief Fetch and parse Billboard Hot 100 charts.
-
-The parser prioritizes JSON-LD extraction for resilience against HTML changes and
-falls back to HTML scraping when JSON-LD is unavailable.
-
-All network calls use a retry-capable `requests.Session`.
-"""
-
-from __future__ import annotations
-
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
-import json
-import re
-
-import requests
-from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-BILLBOARD_URL = "https://www.billboard.com/charts/hot-100/{date_str}/"
-
-
-@dataclass(frozen=True)
-class ChartEntry:
-    """!
-    @brief Represents a single chart entry.
-
-    @param rank Chart position (1..N).
-    @param title Track title.
-    @param artist Track artist.
-    """
-
-    rank: int
-    title: str
-    artist: str
-
-    def to_dict(self) -> Dict[str, str | int]:
-        """!
-        @brief Convert the entry into a JSON-serializable dict.
-        @return A dict with keys: rank, title, artist.
-        """
-        return asdict(self)
-
-
-def _build_session() -> requests.Session:
-    """!
-    @brief Create a requests session configured with retries and headers.
-    @return A configured `requests.Session`.
-    """
-    s = requests.Session()
-    retry = Retry(
-        total=3,
-        connect=3,
-        read=3,
-        backoff_factor=0.6,
-        status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=frozenset(["GET"]),
-        raise_on_status=False,
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    s.mount("https://", adapter)
-    s.mount("http://", adapter)
-    s.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0",
-            "Accept-Language": "en-US,en;q=0.9,pt-BR;q=0.8,pt;q=0.7",
-        }
-    )
-    return s
-
-
-def _clean(x: str) -> str:
-    """!
-    @brief Normalize whitespace and trim.
-    @param x Input string.
-    @return Cleaned string.
-    """
-    return re.sub(r"\s+", " ", (x or "").strip())
-
-
-def _parse_jsonld_itemlist(obj: dict, limit: int) -> List[ChartEntry]:
-    """!
-    @brief Extract entries from a JSON-LD ItemList structure.
-
-    Expected format:
-    - @type == "ItemList"
-    - itemListElement contains ListItem objects with `position` and `item`
-
-    @param obj Parsed JSON-LD object.
-    @param limit Maximum number of entries to return.
-    @return List of extracted `ChartEntry`.
-    """
-    entries: List[ChartEntry] = []
-
-    if obj.get("@type") != "ItemList":
-        return entries
-
-    items = obj.get("itemListElement")
-    if not isinstance(items, list):
-        return entries
-
-    for it in items:
-        if not isinstance(it, dict) or it.get("@type") != "ListItem":
-            continue
-
-        pos = it.get("position")
-        item = it.get("item", {})
-        if not isinstance(item, dict):
-            continue
-
-        title = _clean(item.get("name", ""))
-        artist = ""
-
-        by = item.get("byArtist")
-        if isinstance(by, dict):
-            artist = _clean(by.get("name", ""))
-        elif isinstance(by, list) and by and isinstance(by[0], dict):
-            artist = _clean(by[0].get("name", ""))
-
-        if not title:
-            continue
-
-        try:
-            rank = int(pos) if pos else len(entries) + 1
-        except Exception:
-            rank = len(entries) + 1
-
-        entries.append(ChartEntry(rank=rank, title=title, artist=artist))
-
-        if len(entries) >= limit:
-            break
-
-    return entries[:limit]
-
-
-def _parse_jsonld(soup: BeautifulSoup, limit: int) -> List[ChartEntry]:
-    """!
-    @brief Extract chart entries via JSON-LD scripts.
-
-    This is the preferred parsing strategy because JSON-LD tends to be more stable
-    than HTML layout.
-
-    @param soup Parsed HTML document.
-    @param limit Maximum number of entries to return.
-    @return List of extracted `ChartEntry`.
-    """
-    entries: List[ChartEntry] = []
-
-    scripts = soup.select('script[type="application/ld+json"]')
-    for sc in scripts:
-        raw = (sc.string or "").strip()
-        if not raw:
-            continue
-
-        try:
-            data = json.loads(raw)
-        except Exception:
-            continue
-
-        queue = data if isinstance(data, list) else [data]
-
-        expanded: List[dict] = []
-        for obj in queue:
-            if isinstance(obj, dict) and isinstance(obj.get("@graph"), list):
-                expanded.extend([x for x in obj["@graph"] if isinstance(x, dict)])
-        queue.extend(expanded)
-
-        for obj in queue:
-            if not isinstance(obj, dict):
-                continue
-
-            extracted = _parse_jsonld_itemlist(obj, limit)
-            if extracted:
-                return extracted
-
-    return entries
-
-
-def _parse_html_fallback(soup: BeautifulSoup, limit: int) -> List[ChartEntry]:
-    """!
-    @brief Fallback HTML parser for chart entries.
-
-    This is used only when JSON-LD extraction fails.
-
-    @param soup Parsed HTML document.
-    @param limit Maximum number of entries to return.
-    @return List of extracted `ChartEntry`.
-    """
-    entries: List[ChartEntry] = []
-    seen = set()
-
-    h3s = soup.select("li.o-chart-results-list__item h3#title-of-a-story")
-    for h3 in h3s:
-        title = _clean(h3.get_text(" ", strip=True))
-        item = h3.find_parent("li", class_="o-chart-results-list__item")
-        artist = ""
-
-        if item:
-            for sp in item.select("span"):
-                txt = _clean(sp.get_text(" ", strip=True))
-                if not txt:
-                    continue
-                if txt.upper() in {"NEW", "RE-ENTRY"}:
-                    continue
-                if len(txt) >= 2 and not txt.isdigit():
-                    artist = txt
-                    break
-
-        key = (title.lower(), artist.lower())
-        if title and key not in seen:
-            seen.add(key)
-            entries.append(ChartEntry(rank=len(entries) + 1, title=title, artist=artist))
-
-        if len(entries) >= limit:
-            break
-
-    return entries[:limit]
-
-
-def fetch_hot100(date_str: str, limit: int = 10, session: Optional[requests.Session] = None) -> List[Dict]:
-    """!
-    @brief Fetch and parse the Billboard Hot 100 for a given chart week.
-
-    @param date_str Chart week in the format `YYYY-MM-DD`.
-    @param limit Maximum number of entries to return.
-    @param session Optional `requests.Session` to reuse connections/retries.
-    @return List of dicts with keys: rank, title, artist.
-    """
-    if limit <= 0:
-        return []
-
-    s = session or _build_session()
-    url = BILLBOARD_URL.format(date_str=date_str)
-
-    r = s.get(url, timeout=25)
-    r.raise_for_status()
-
-    soup = BeautifulSoup(r.text, "html.parser")
-
-    entries = _parse_jsonld(soup, limit)
-    if not entries:
-        entries = _parse_html_fallback(soup, limit)
-
-    return [e.to_dict() for e in entries]
+"""!
+@file services/billboard.py
+@brief Fetch and parse Billboard Hot 100 charts.
+
+The parser prioritizes JSON-LD extraction for resilience against HTML changes and
+falls back to HTML scraping when JSON-LD is unavailable.
+
+All network calls use a retry-capable `requests.Session`.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Dict, Optional
+import asyncio
+import json
+import operator
+import re
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - async fan-out is optional
+    aiohttp = None
+
+# Fastest available JSON decoder: simdjson (SIMD-accelerated) when present,
+# then orjson, then stdlib. All three accept str and bytes input.
+try:
+    import simdjson
+
+    _loads = simdjson.loads
+    _SIMD_PARSER = simdjson.Parser()
+except ImportError:  # pragma: no cover - non-x86 targets / local dev
+    simdjson = None
+    _SIMD_PARSER = None
+    try:
+        import orjson
+
+        _loads = orjson.loads
+    except ImportError:  # pragma: no cover - local dev without orjson
+        _loads = json.loads
+
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import diskcache
+
+    _CHART_CACHE = diskcache.Cache("/tmp/hotmusic-charts")
+except Exception:  # pragma: no cover - local dev without diskcache
+    _CHART_CACHE = None
+
+BILLBOARD_URL = "https://www.billboard.com/charts/hot-100/{date_str}/"
+
+_WS_RE = re.compile(r"\s+")
+
+# Deliberately loose about quoting and attribute order: the payload filter in
+# _parse_jsonld_payload rejects any non-ItemList script this happens to match.
+_JSONLD_RE = re.compile(
+    r"<script[^>]*application/ld\+json[^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+_JSONLD_RE_B = re.compile(
+    rb"<script[^>]*application/ld\+json[^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# XPath expressions are compiled once at import; per-call CSS selector
+# compilation was a measurable cost in the DOM fallback.
+_X_SCRIPTS = etree.XPath('//script[@type="application/ld+json"]/text()')
+_X_ROWS = etree.XPath(
+    '//li[contains(@class,"o-chart-results-list__item")][.//h3[@id="title-of-a-story"]]'
+)
+_X_TITLE = etree.XPath('.//h3[@id="title-of-a-story"]')
+_X_SPANS = etree.XPath(".//span")
+
+_get_pos = operator.itemgetter("position")
+_get_item = operator.itemgetter("item")
+
+
+def _build_session() -> requests.Session:
+    """!
+    @brief Create a requests session configured with retries and headers.
+    @return A configured `requests.Session`.
+    """
+    s = requests.Session()
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=3,
+        backoff_factor=0.6,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=32)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0",
+            "Accept-Language": "en-US,en;q=0.9,pt-BR;q=0.8,pt;q=0.7",
+        }
+    )
+    return s
+
+
+_SESSION = _build_session()
+
+
+def _clean(x: str) -> str:
+    """!
+    @brief Normalize whitespace and trim.
+
+    JSON-LD strings are almost always already normalized, so the regex pass
+    only runs when multi-whitespace is actually present.
+
+    @param x Input string.
+    @return Cleaned string.
+    """
+    if not x:
+        return ""
+    s = x.strip()
+    if "  " not in s and "\t" not in s and "\n" not in s:
+        return s
+    return _WS_RE.sub(" ", s)
+
+
+def _parse_itemlist_fast(obj: dict, limit: int) -> List[Dict]:
+    """!
+    @brief Schema-specialized extractor for Billboard's fixed ItemList shape.
+
+    Billboard's JSON-LD schema is stable: itemListElement[] of ListItem with
+    `position`, `item.name` and `item.byArtist.name`. This walks that exact
+    path with direct indexing and no per-row type checks; any deviation raises
+    and the caller falls back to the tolerant parser.
+
+    @param obj Parsed JSON-LD object (assumed @type == "ItemList").
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts.
+    @throws Exception When the payload deviates from the expected schema.
+    """
+    # JSON numbers decode straight to int; only coerce string positions.
+    entries = [
+        {
+            "rank": pos if type(pos := _get_pos(e)) is int else int(pos),
+            "title": _clean((it := _get_item(e))["name"]),
+            "artist": _clean(it["byArtist"]["name"]),
+        }
+        for e in obj["itemListElement"][:limit]
+    ]
+
+    if any(not e["title"] for e in entries):
+        raise ValueError("entry without title")
+
+    return entries
+
+
+def _parse_jsonld_itemlist(obj: dict, limit: int) -> List[Dict]:
+    """!
+    @brief Extract entries from a JSON-LD ItemList structure.
+
+    Expected format:
+    - @type == "ItemList"
+    - itemListElement contains ListItem objects with `position` and `item`
+
+    Tries the schema-specialized fast path first and falls back to the
+    tolerant per-field walk when the payload deviates.
+
+    @param obj Parsed JSON-LD object.
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts.
+    """
+    entries: List[Dict] = []
+
+    if obj.get("@type") != "ItemList":
+        return entries
+
+    try:
+        return _parse_itemlist_fast(obj, limit)
+    except Exception:
+        pass
+
+    items = obj.get("itemListElement")
+    if not isinstance(items, list):
+        return entries
+
+    for it in items:
+        if not isinstance(it, dict) or it.get("@type") != "ListItem":
+            continue
+
+        pos = it.get("position")
+        item = it.get("item", {})
+        if not isinstance(item, dict):
+            continue
+
+        title = _clean(item.get("name", ""))
+        artist = ""
+
+        by = item.get("byArtist")
+        if isinstance(by, dict):
+            artist = _clean(by.get("name", ""))
+        elif isinstance(by, list) and by and isinstance(by[0], dict):
+            artist = _clean(by[0].get("name", ""))
+
+        if not title:
+            continue
+
+        try:
+            rank = int(pos) if pos else len(entries) + 1
+        except Exception:
+            rank = len(entries) + 1
+
+        entries.append({"rank": rank, "title": title, "artist": artist})
+
+        if len(entries) >= limit:
+            break
+
+    return entries[:limit]
+
+
+def _lazy_itemlist(obj, limit: int) -> List[Dict]:
+    """!
+    @brief Extract entries from a simdjson Object holding an ItemList.
+
+    Only `position`, `item.name` and `item.byArtist.name` are ever touched,
+    so the proxies never materialize the unused ListItem fields (`@id`,
+    `url`, thumbnails, ...).
+
+    @param obj `simdjson.Object` candidate node.
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts.
+    @throws Exception When the payload deviates from the expected schema.
+    """
+    if obj.get("@type") != "ItemList":
+        return []
+
+    entries: List[Dict] = []
+    for e in obj["itemListElement"]:
+        item = e["item"]
+        title = _clean(item["name"])
+        if not title:
+            raise ValueError("entry without title")
+        pos = e["position"]
+        entries.append(
+            {
+                "rank": pos if type(pos) is int else int(pos),
+                "title": title,
+                "artist": _clean(item["byArtist"]["name"]),
+            }
+        )
+        if len(entries) >= limit:
+            break
+    return entries
+
+
+def _parse_jsonld_payload_lazy(raw: str | bytes, limit: int) -> List[Dict]:
+    """!
+    @brief On-demand JSON-LD extraction via simdjson proxies.
+
+    @param raw Raw JSON-LD script contents (str or UTF-8 bytes).
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts (empty if no ItemList found).
+    @throws Exception On schema deviation or concurrent parser reuse; the
+            caller falls back to full materialization.
+    """
+    doc = _SIMD_PARSER.parse(raw)
+    nodes = doc if isinstance(doc, simdjson.Array) else (doc,)
+
+    for obj in nodes:
+        if not isinstance(obj, simdjson.Object):
+            continue
+
+        entries = _lazy_itemlist(obj, limit)
+        if entries:
+            return entries
+
+        graph = obj.get("@graph")
+        if isinstance(graph, simdjson.Array):
+            for g in graph:
+                if isinstance(g, simdjson.Object):
+                    entries = _lazy_itemlist(g, limit)
+                    if entries:
+                        return entries
+
+    return []
+
+
+def _parse_jsonld_payload(raw: str | bytes, limit: int) -> List[Dict]:
+    """!
+    @brief Decode one JSON-LD script payload and extract chart entries.
+
+    Handles top-level objects, lists, and `@graph` wrappers. Accepts bytes
+    directly: every decoder in the `_loads` cascade takes UTF-8 bytes, which
+    spares the streaming scanner a str decode per script.
+
+    @param raw Raw JSON-LD script contents (str or UTF-8 bytes).
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts (empty if no ItemList found).
+    """
+    # Billboard pages also ship organization/breadcrumb/article JSON-LD; only
+    # payloads mentioning ItemList are worth decoding.
+    needle = b'"ItemList"' if isinstance(raw, (bytes, bytearray)) else '"ItemList"'
+    if needle not in raw:
+        return []
+
+    # Lazy path first: skips materializing the fields nobody reads. Any
+    # schema deviation (or a busy shared parser) drops to the full decode.
+    if _SIMD_PARSER is not None:
+        try:
+            entries = _parse_jsonld_payload_lazy(raw, limit)
+        except Exception:
+            entries = []
+        if entries:
+            return entries
+
+    try:
+        data = _loads(raw)
+    except Exception:
+        return []
+
+    queue = data if isinstance(data, list) else [data]
+
+    for obj in queue:
+        if not isinstance(obj, dict):
+            continue
+
+        extracted = _parse_jsonld_itemlist(obj, limit)
+        if extracted:
+            return extracted
+
+        graph = obj.get("@graph")
+        if isinstance(graph, list):
+            for g in graph:
+                if not isinstance(g, dict):
+                    continue
+                extracted = _parse_jsonld_itemlist(g, limit)
+                if extracted:
+                    return extracted
+
+    return []
+
+
+def _parse_jsonld_from_text(html_text: str, limit: int) -> List[Dict]:
+    """!
+    @brief Extract chart entries from JSON-LD scripts using a regex scan.
+
+    JSON-LD payloads are self-delimited, so a linear regex scan over the raw
+    HTML avoids building a DOM on the common path.
+
+    @param html_text Raw HTML document text.
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts (empty if no ItemList found).
+    """
+    for m in _JSONLD_RE.finditer(html_text):
+        raw = m.group(1).strip()
+        if not raw:
+            continue
+
+        entries = _parse_jsonld_payload(raw, limit)
+        if entries:
+            return entries
+
+    return []
+
+
+def _parse_document(html_text: str, limit: int) -> List[Dict]:
+    """!
+    @brief Parse a fully materialized HTML document into chart entries.
+
+    Runs the regex JSON-LD scan first and falls back to DOM parsing.
+
+    @param html_text Raw HTML document text.
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts.
+    """
+    entries = _parse_jsonld_from_text(html_text, limit)
+    if not entries and html_text:
+        doc = etree.HTML(html_text)
+        if doc is not None:
+            entries = _parse_jsonld(doc, limit)
+            if not entries:
+                entries = _parse_html_fallback(doc, limit)
+    return entries
+
+
+def _scan_response(r, limit: int):
+    """!
+    @brief Incrementally scan a response body for JSON-LD chart entries.
+
+    Streams the body in chunks and stops as soon as an ItemList payload is
+    found, so most of the page is never downloaded or decoded on the common
+    path. The JSON-LD block sits near the top of `<head>` on Billboard pages.
+
+    @param r Response object (streamed when it supports `iter_content`).
+    @param limit Maximum number of entries to return.
+    @return Tuple (entries, html_text). `html_text` is the fully decoded body
+            when no entries were found, or `None` on an early exit.
+    """
+    if not hasattr(r, "iter_content"):
+        text = r.text
+        return _parse_jsonld_from_text(text, limit), text
+
+    buf = bytearray()
+    pos = 0  # resume point: every complete script before it is already parsed
+    for chunk in r.iter_content(chunk_size=65536):
+        if not chunk:
+            continue
+        buf.extend(chunk)
+
+        while True:
+            m = _JSONLD_RE_B.search(buf, pos)
+            if m is None:
+                break
+            raw = bytes(m.group(1)).strip()
+            if raw:
+                entries = _parse_jsonld_payload(raw, limit)
+                if entries:
+                    r.close()
+                    return entries, None
+            pos = m.end()
+
+    return [], bytes(buf).decode(getattr(r, "encoding", None) or "utf-8", "replace")
+
+
+def _parse_jsonld(doc: etree._Element, limit: int) -> List[Dict]:
+    """!
+    @brief Extract chart entries via JSON-LD scripts.
+
+    This is the preferred parsing strategy because JSON-LD tends to be more stable
+    than HTML layout.
+
+    @param doc Parsed HTML document.
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts.
+    """
+    for raw in _X_SCRIPTS(doc):
+        raw = (raw or "").strip()
+        if not raw:
+            continue
+
+        entries = _parse_jsonld_payload(raw, limit)
+        if entries:
+            return entries
+
+    return []
+
+
+def _parse_html_fallback(doc: etree._Element, limit: int) -> List[Dict]:
+    """!
+    @brief Fallback HTML parser for chart entries.
+
+    This is used only when JSON-LD extraction fails.
+
+    @param doc Parsed HTML document.
+    @param limit Maximum number of entries to return.
+    @return List of extracted entry dicts.
+    """
+    entries: List[Dict] = []
+    seen = set()
+
+    for item in _X_ROWS(doc):
+        h3s = _X_TITLE(item)
+        if not h3s:
+            continue
+
+        title = _clean(" ".join(h3s[0].itertext()))
+        artist = ""
+
+        for sp in _X_SPANS(item):
+            txt = _clean(" ".join(sp.itertext()))
+            if not txt:
+                continue
+            if txt.upper() in {"NEW", "RE-ENTRY"}:
+                continue
+            if len(txt) >= 2 and not txt.isdigit():
+                artist = txt
+                break
+
+        key = (title.lower(), artist.lower())
+        if title and key not in seen:
+            seen.add(key)
+            entries.append({"rank": len(entries) + 1, "title": title, "artist": artist})
+
+        if len(entries) >= limit:
+            break
+
+    return entries[:limit]
+
+
+def fetch_hot100(date_str: str, limit: int = 10, session: Optional[requests.Session] = None) -> List[Dict]:
+    """!
+    @brief Fetch and parse the Billboard Hot 100 for a given chart week.
+
+    @param date_str Chart week in the format `YYYY-MM-DD`.
+    @param limit Maximum number of entries to return.
+    @param session Optional `requests.Session` to reuse connections/retries.
+    @return List of dicts with keys: rank, title, artist.
+    """
+    if limit <= 0:
+        return []
+
+    # Past chart weeks never change, so parsed results persist across
+    # process restarts (same pattern as the link cache in services.links).
+    cache_key = (date_str, limit)
+    if _CHART_CACHE is not None:
+        cached = _CHART_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+    s = session or _SESSION
+    url = BILLBOARD_URL.format(date_str=date_str)
+
+    r = s.get(url, timeout=25, stream=True)
+    r.raise_for_status()
+
+    entries, html_text = _scan_response(r, limit)
+    if not entries and html_text:
+        doc = etree.HTML(html_text)
+        if doc is not None:
+            entries = _parse_jsonld(doc, limit)
+            if not entries:
+                entries = _parse_html_fallback(doc, limit)
+
+    if entries and _CHART_CACHE is not None:
+        _CHART_CACHE.set(cache_key, entries)
+
+    return entries
+
+
+async def fetch_hot100_async(date_str: str, limit: int, session) -> List[Dict]:
+    """!
+    @brief Async variant of `fetch_hot100` for concurrent multi-date fetches.
+
+    @param date_str Chart week in the format `YYYY-MM-DD`.
+    @param limit Maximum number of entries to return.
+    @param session An `aiohttp.ClientSession` shared by the batch.
+    @return List of dicts with keys: rank, title, artist.
+    """
+    if limit <= 0:
+        return []
+
+    url = BILLBOARD_URL.format(date_str=date_str)
+
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=25)) as r:
+        r.raise_for_status()
+        html_text = await r.text()
+
+    return _parse_document(html_text, limit)
+
+
+def fetch_hot100_many(dates: Iterable[str], limit: int = 10) -> List[List[Dict]]:
+    """!
+    @brief Fetch several chart weeks concurrently.
+
+    Fans the dates out over one `aiohttp.ClientSession`, so an N-date batch
+    costs roughly one round-trip of wall time instead of N.
+
+    @param dates Chart weeks in the format `YYYY-MM-DD`.
+    @param limit Maximum number of entries to return per week.
+    @return One entry list per date, in input order.
+    """
+    dates = list(dates)
+    if not dates:
+        return []
+
+    if aiohttp is None:
+        raise RuntimeError("fetch_hot100_many requires aiohttp; install it or call fetch_hot100 per date")
+
+    async def _run() -> List[List[Dict]]:
+        connector = aiohttp.TCPConnector(limit_per_host=64)
+        headers = {
+            "User-Agent": "Mozilla/5.0",
+            "Accept-Language": "en-US,en;q=0.9,pt-BR;q=0.8,pt;q=0.7",
+        }
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            return await asyncio.gather(*(fetch_hot100_async(d, limit, session) for d in dates))
+
+    return asyncio.run(_run())
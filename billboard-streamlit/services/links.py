@@ -1,158 +1,297 @@
-"""!
-@file services/links.py
-@brief Utilities to generate Spotify links without using the Spotify API.
-
-This module attempts to resolve a direct Spotify URL using a best-effort strategy:
-1) iTunes Search -> obtain a track URL
-2) Odesli (song.link) -> convert to platform links and pick Spotify
-3) Fallback to a Spotify Search URL
-
-All network calls use a retry-capable `requests.Session`.
-"""
-
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import Optional, Literal
-from urllib.parse import quote
-
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-
-ITUNES_SEARCH = "https://itunes.apple.com/search"
-ODESLI_API = "https://api.song.link/v1-alpha.1/links?url="
-
-Method = Literal["odesli", "search_fallback"]
-
-
-@dataclass(frozen=True)
-class SpotifyLinkResult:
-    """!
-    @brief Result of Spotify link resolution.
-
-    @param url Resolved Spotify URL (direct or search).
-    @param method Resolution method used.
-    """
-
-    url: str
-    method: Method
-
-
-def _build_session() -> requests.Session:
-    """!
-    @brief Create a requests session configured with retries and headers.
-    @return A configured `requests.Session`.
-    """
-    s = requests.Session()
-    retry = Retry(
-        total=3,
-        connect=3,
-        read=3,
-        backoff_factor=0.6,
-        status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=frozenset(["GET"]),
-        raise_on_status=False,
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    s.mount("https://", adapter)
-    s.mount("http://", adapter)
-    s.headers.update({"User-Agent": "Mozilla/5.0"})
-    return s
-
-
-def itunes_find_track_url(
-    title: str, artist: str, session: Optional[requests.Session] = None
-) -> Optional[str]:
-    """!
-    @brief Search iTunes for a track and return its `trackViewUrl`.
-
-    The returned URL is typically used as the input for Odesli conversion.
-
-    @param title Track title.
-    @param artist Track artist.
-    @param session Optional `requests.Session` to reuse connections/retries.
-    @return A track URL if found, otherwise `None`.
-    """
-    term = f"{title} {artist}".strip()
-    if not term:
-        return None
-
-    s = session or _build_session()
-    params = {
-        "term": term,
-        "media": "music",
-        "entity": "song",
-        "limit": 1,
-        "country": "US",
-    }
-    r = s.get(ITUNES_SEARCH, params=params, timeout=20)
-    r.raise_for_status()
-    data = r.json()
-
-    results = data.get("results", [])
-    if not results:
-        return None
-    return results[0].get("trackViewUrl")
-
-
-def odesli_get_spotify_url(source_url: str, session: Optional[requests.Session] = None) -> Optional[str]:
-    """!
-    @brief Convert a source URL (e.g., iTunes) into a Spotify URL using Odesli.
-
-    @param source_url Source track URL to convert.
-    @param session Optional `requests.Session` to reuse connections/retries.
-    @return Spotify URL if available, otherwise `None`.
-    """
-    if not source_url:
-        return None
-
-    s = session or _build_session()
-    r = s.get(ODESLI_API + quote(source_url, safe=""), timeout=20)
-    r.raise_for_status()
-    data = r.json()
-
-    links = data.get("linksByPlatform", {}) or {}
-    sp = links.get("spotify")
-    if isinstance(sp, dict):
-        return sp.get("url")
-    return None
-
-
-def spotify_search_url(title: str, artist: str) -> str:
-    """!
-    @brief Build a Spotify search URL for the given title and artist.
-
-    @param title Track title.
-    @param artist Track artist.
-    @return Spotify search URL.
-    """
-    q = quote(f"{title} {artist}".strip())
-    return f"https://open.spotify.com/search/{q}"
-
-
-def best_spotify_link(title: str, artist: str, session: Optional[requests.Session] = None) -> SpotifyLinkResult:
-    """!
-    @brief Resolve the best Spotify link for a track without using Spotify APIs.
-
-    Strategy:
-    - Try: iTunes -> Odesli -> Spotify (preferred)
-    - Fallback: Spotify search URL
-
-    @param title Track title.
-    @param artist Track artist.
-    @param session Optional `requests.Session` to reuse connections/retries.
-    @return A `SpotifyLinkResult` containing the URL and the resolution method.
-    """
-    s = session or _build_session()
-    try:
-        it_url = itunes_find_track_url(title, artist, session=s)
-        if it_url:
-            sp = odesli_get_spotify_url(it_url, session=s)
-            if sp:
-                return SpotifyLinkResult(url=sp, method="odesli")
-    except Exception:
-        pass
-
-    return SpotifyLinkResult(url=spotify_search_url(title, artist), method="search_fallback")
+"""!
+@file services/links.py
+@brief Utilities to generate Spotify links without using the Spotify API.
+
+This module attempts to resolve a direct Spotify URL using a best-effort strategy:
+1) iTunes Search -> obtain track metadata (URL, ISRC when present)
+2) ISRC present -> build a Spotify `isrc:` search link directly (no Odesli call)
+3) Odesli (song.link) -> convert the iTunes URL to platform links and pick Spotify
+4) Fallback to a Spotify Search URL
+
+All network calls use a retry-capable `requests.Session`.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Literal, Tuple
+from urllib.parse import quote, quote_plus
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - local dev without httpx
+    httpx = None
+
+try:
+    import diskcache
+
+    _DISK_CACHE = diskcache.Cache("/tmp/hotmusic-links")
+except Exception:  # pragma: no cover - local dev without diskcache
+    _DISK_CACHE = None
+
+# Links for a given (title, artist) change rarely; a week keeps cold boots cheap.
+_DISK_CACHE_TTL = 7 * 86400
+
+ITUNES_SEARCH = "https://itunes.apple.com/search"
+ODESLI_API = "https://api.song.link/v1-alpha.1/links?url="
+SPOTIFY_SEARCH_BASE = "https://open.spotify.com/search/"
+
+Method = Literal["odesli", "itunes_isrc", "search_fallback"]
+
+
+@dataclass(frozen=True)
+class SpotifyLinkResult:
+    """!
+    @brief Result of Spotify link resolution.
+
+    @param url Resolved Spotify URL (direct or search).
+    @param method Resolution method used.
+    """
+
+    url: str
+    method: Method
+
+
+def _build_session():
+    """!
+    @brief Create an HTTP session configured with retries and headers.
+
+    Prefers an HTTP/2-capable `httpx.Client` — both itunes.apple.com and
+    api.song.link speak HTTP/2, which multiplexes concurrent lookups over one
+    connection. Falls back to a `requests.Session` when httpx is missing.
+    The two expose the same `.get(...).json()` surface used here.
+
+    @return A configured `httpx.Client` or `requests.Session`.
+    """
+    if httpx is not None:
+        transport = httpx.HTTPTransport(
+            retries=3,
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+        return httpx.Client(
+            transport=transport,
+            timeout=20,
+            follow_redirects=True,
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+
+    s = requests.Session()
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=3,
+        backoff_factor=0.6,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=32)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update({"User-Agent": "Mozilla/5.0"})
+    return s
+
+
+_SESSION = _build_session()
+
+# Single-flight map: concurrent lookups for the same (title, artist) share
+# one resolution instead of firing duplicate network calls.
+_INFLIGHT: Dict[Tuple[str, str], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def itunes_search_track(
+    title: str, artist: str, session: Optional[requests.Session] = None
+) -> Optional[dict]:
+    """!
+    @brief Search iTunes for a track and return the first raw result.
+
+    The result dict carries `trackViewUrl` plus metadata such as `trackName`,
+    `artistName`, and occasionally `isrc`.
+
+    @param title Track title.
+    @param artist Track artist.
+    @param session Optional `requests.Session` to reuse connections/retries.
+    @return The first result dict if found, otherwise `None`.
+    """
+    term = f"{title} {artist}".strip()
+    if not term:
+        return None
+
+    s = session or _SESSION
+    params = {
+        "term": term,
+        "media": "music",
+        "entity": "song",
+        "limit": 1,
+        "country": "US",
+    }
+    r = s.get(ITUNES_SEARCH, params=params, timeout=20)
+    r.raise_for_status()
+    data = r.json()
+
+    results = data.get("results", [])
+    if not results or not isinstance(results[0], dict):
+        return None
+    return results[0]
+
+
+def itunes_find_track_url(
+    title: str, artist: str, session: Optional[requests.Session] = None
+) -> Optional[str]:
+    """!
+    @brief Search iTunes for a track and return its `trackViewUrl`.
+
+    The returned URL is typically used as the input for Odesli conversion.
+
+    @param title Track title.
+    @param artist Track artist.
+    @param session Optional `requests.Session` to reuse connections/retries.
+    @return A track URL if found, otherwise `None`.
+    """
+    track = itunes_search_track(title, artist, session=session)
+    if not track:
+        return None
+    return track.get("trackViewUrl")
+
+
+def odesli_get_spotify_url(source_url: str, session: Optional[requests.Session] = None) -> Optional[str]:
+    """!
+    @brief Convert a source URL (e.g., iTunes) into a Spotify URL using Odesli.
+
+    @param source_url Source track URL to convert.
+    @param session Optional `requests.Session` to reuse connections/retries.
+    @return Spotify URL if available, otherwise `None`.
+    """
+    if not source_url:
+        return None
+
+    s = session or _SESSION
+    r = s.get(ODESLI_API + quote(source_url, safe=""), timeout=20)
+    r.raise_for_status()
+    data = r.json()
+
+    links = data.get("linksByPlatform", {}) or {}
+    sp = links.get("spotify")
+    if isinstance(sp, dict):
+        return sp.get("url")
+    return None
+
+
+@lru_cache(maxsize=4096)
+def spotify_search_url(title: str, artist: str) -> str:
+    """!
+    @brief Build a Spotify search URL for the given title and artist.
+
+    Memoized: charts repeat (title, artist) pairs across weeks and Streamlit
+    re-renders on every widget interaction.
+
+    @param title Track title.
+    @param artist Track artist.
+    @return Spotify search URL.
+    """
+    return SPOTIFY_SEARCH_BASE + quote_plus(f"{title} {artist}".strip())
+
+
+def _resolve_spotify_link(title: str, artist: str, session: Optional[requests.Session] = None) -> SpotifyLinkResult:
+    """!
+    @brief Run the actual link resolution pipeline for a track.
+
+    @param title Track title.
+    @param artist Track artist.
+    @param session Optional `requests.Session` to reuse connections/retries.
+    @return A `SpotifyLinkResult` containing the URL and the resolution method.
+    """
+    key = (title.strip().lower(), artist.strip().lower())
+    if _DISK_CACHE is not None:
+        cached = _DISK_CACHE.get(key)
+        if cached is not None:
+            return SpotifyLinkResult(url=cached[0], method=cached[1])
+
+    s = session or _SESSION
+    try:
+        track = itunes_search_track(title, artist, session=s)
+        if track:
+            isrc = track.get("isrc")
+            if isrc:
+                result = SpotifyLinkResult(
+                    url=f"https://open.spotify.com/search/{quote(f'isrc:{isrc}', safe='')}",
+                    method="itunes_isrc",
+                )
+            else:
+                result = None
+                it_url = track.get("trackViewUrl")
+                if it_url:
+                    sp = odesli_get_spotify_url(it_url, session=s)
+                    if sp:
+                        result = SpotifyLinkResult(url=sp, method="odesli")
+
+            if result is not None:
+                if _DISK_CACHE is not None:
+                    _DISK_CACHE.set(key, (result.url, result.method), expire=_DISK_CACHE_TTL)
+                return result
+    except Exception:
+        pass
+
+    # Fallbacks are not persisted: a transient network failure should not
+    # pin a search URL to this track for a week.
+    return SpotifyLinkResult(url=spotify_search_url(title, artist), method="search_fallback")
+
+
+def best_spotify_link(title: str, artist: str, session: Optional[requests.Session] = None) -> SpotifyLinkResult:
+    """!
+    @brief Resolve the best Spotify link for a track without using Spotify APIs.
+
+    Strategy:
+    - Try: iTunes -> ISRC search link (preferred, single round-trip)
+    - Try: iTunes -> Odesli -> Spotify
+    - Fallback: Spotify search URL
+
+    Concurrent callers asking for the same (title, artist) are coalesced into
+    a single resolution; the extra callers block on its result.
+
+    @param title Track title.
+    @param artist Track artist.
+    @param session Optional `requests.Session` to reuse connections/retries.
+    @return A `SpotifyLinkResult` containing the URL and the resolution method.
+    """
+    title = (title or "").strip()
+    artist = (artist or "").strip()
+
+    # Empty or obviously malformed scrapes cannot resolve to anything better
+    # than a search URL, so do not spend network calls on them.
+    if not title or len(title) < 2 or title.lower() == artist.lower():
+        return SpotifyLinkResult(url=spotify_search_url(title, artist), method="search_fallback")
+
+    key = (title.lower(), artist.lower())
+
+    with _INFLIGHT_LOCK:
+        fut = _INFLIGHT.get(key)
+        if fut is not None:
+            owner = False
+        else:
+            fut = Future()
+            _INFLIGHT[key] = fut
+            owner = True
+
+    if not owner:
+        return fut.result()
+
+    try:
+        result = _resolve_spotify_link(title, artist, session=session)
+        fut.set_result(result)
+        return result
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
@@ -1,14 +1,113 @@
-"""!
-@file tests/conftest.py
-@brief Pytest configuration for import path setup.
-
-Ensures the project root is available on `sys.path` so imports like
-`from services...` work when running tests.
-"""
-
-import sys
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+"""!
+@file tests/conftest.py
+@brief Shared fixtures for offline Billboard tests.
+
+Import paths are configured via `pythonpath` in pyproject.toml; this module
+only provides transport-level HTTP mocking.
+"""
+
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+import responses
+
+SAMPLE_HTML = """
+<html><head>
+  <script type="application/ld+json">
+  {
+    "@type": "ItemList",
+    "itemListElement": [
+      {"@type":"ListItem","position":1,"item":{"name":"Song A","byArtist":{"name":"Artist A"}}},
+      {"@type":"ListItem","position":2,"item":{"name":"Song B","byArtist":{"name":"Artist B"}}}
+    ]
+  }
+  </script>
+</head><body></body></html>
+"""
+
+SAMPLE_GRAPH_HTML = """
+<html><head>
+  <script type="application/ld+json">
+  {
+    "@graph": [
+      {"@type": "WebPage", "name": "Hot 100"},
+      {
+        "@type": "ItemList",
+        "itemListElement": [
+          {"@type":"ListItem","position":1,"item":{"name":"Song A","byArtist":{"name":"Artist A"}}},
+          {"@type":"ListItem","position":2,"item":{"name":"Song B","byArtist":{"name":"Artist B"}}}
+        ]
+      }
+    ]
+  }
+  </script>
+</head><body></body></html>
+"""
+
+SAMPLE_HTML_BYTES = SAMPLE_HTML.encode()
+
+_HTML_VARIANTS = {
+    "itemlist": SAMPLE_HTML,
+    "graph-wrapped": SAMPLE_GRAPH_HTML,
+}
+
+
+@pytest.fixture(autouse=True)
+def _no_chart_cache(monkeypatch):
+    """!
+    @brief Keep tests hermetic: never serve charts from the on-disk cache.
+    """
+    import services.billboard as billboard
+
+    monkeypatch.setattr(billboard, "_CHART_CACHE", None)
+
+
+@pytest.fixture
+def billboard_html_session(request):
+    """!
+    @brief Real `requests.Session` with billboard.com mocked at the transport level.
+
+    Any GET to a Billboard chart URL returns `SAMPLE_HTML` by default; tests
+    can select another `_HTML_VARIANTS` key via indirect parametrization.
+    Mocking below the session keeps the connection-pool code paths exercised
+    and is thread-safe, unlike module-global stubs.
+    """
+    html = _HTML_VARIANTS[getattr(request, "param", "itemlist")]
+    with responses.RequestsMock() as mock:
+        mock.add(
+            responses.GET,
+            re.compile(r"https://www\.billboard\.com/charts/.*"),
+            body=html,
+            status=200,
+        )
+        yield requests.Session()
+
+
+@pytest.fixture(scope="session")
+def local_billboard_server():
+    """!
+    @brief Localhost HTTP server serving `SAMPLE_HTML` for full-stack tests.
+
+    Unlike the transport mock, requests made here traverse the real
+    connection-pool/urllib3/socket path, so the fetch pipeline can be
+    measured end to end without network access.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(SAMPLE_HTML_BYTES)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_port}"
+    srv.shutdown()
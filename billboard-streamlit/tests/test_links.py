@@ -1,15 +1,25 @@
-"""!
-@file tests/test_links.py
-@brief Tests for Spotify search URL generation.
-"""
-
-from services.links import spotify_search_url
-
-
-def test_spotify_search_url():
-    """!
-    @brief Ensures `spotify_search_url` produces a Spotify search URL.
-    """
-    url = spotify_search_url("Hello", "Adele")
-    assert url.startswith("https://open.spotify.com/search/")
-    assert "Hello" in url or "hello" in url.lower()
+"""!
+@file tests/test_links.py
+@brief Tests for Spotify search URL generation.
+"""
+
+import pytest
+
+from services.links import spotify_search_url
+
+
+@pytest.mark.parametrize(
+    ("title", "artist"),
+    [
+        ("Hello", "Adele"),
+        ("Blinding Lights", "The Weeknd"),
+    ],
+)
+def test_spotify_search_url(title, artist):
+    """!
+    @brief Validates the Spotify search URL format and query contents.
+    """
+    url = spotify_search_url(title, artist)
+    assert url.startswith("https://open.spotify.com/search/")
+    assert title.split()[0].lower() in url.lower()
+    assert artist.split()[0].lower() in url.lower()